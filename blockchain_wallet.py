@@ -7,15 +7,71 @@ requiring a live chain connection.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 import hashlib
 import math
-import secrets
-from typing import Dict, List, Optional
+import os
+import time
+from typing import Dict, Iterable, List, Optional
 
+# NumPy only backs the opt-in ColumnarLedger; the wallet service itself
+# stays importable without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
+# Shared SHA-256 state cloned per hash so hot paths skip the per-call
+# hasher re-initialization inside hashlib.sha256(payload).
+_SHA256_TEMPLATE = hashlib.sha256()
+
+# Transaction-id hasher pre-seeded with the domain prefix, so transfer()
+# only feeds the per-transaction fields into a copy.
+_TX_ID_TEMPLATE = hashlib.sha256(b"annaban-tx|")
+
+
+def _fast_iso(timestamp_ns: int) -> str:
+    """Build a UTC ISO-8601 timestamp from nanoseconds without datetime.
+
+    Equivalent to datetime.utcnow().isoformat() for the given instant, but
+    uses integer divmod plus the standard civil-from-days conversion, so
+    hot transfer loops avoid allocating datetime objects and running the
+    isoformat machinery twice per transfer.
+    """
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    days, seconds_of_day = divmod(seconds, 86_400)
+    hours, remainder = divmod(seconds_of_day, 3_600)
+    minutes, secs = divmod(remainder, 60)
+
+    # Civil-from-days conversion, with days counted since 1970-01-01.
+    era_days = days + 719_468
+    era = era_days // 146_097
+    day_of_era = era_days - era * 146_097
+    year_of_era = (
+        day_of_era - day_of_era // 1_460 + day_of_era // 36_524 - day_of_era // 146_096
+    ) // 365
+    year = year_of_era + era * 400
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_offset = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_offset + 2) // 5 + 1
+    month = month_offset + 3 if month_offset < 10 else month_offset - 9
+    if month <= 2:
+        year += 1
+
+    return (
+        f"{year:04d}-{month:02d}-{day:02d}"
+        f"T{hours:02d}:{minutes:02d}:{secs:02d}.{nanos // 1000:06d}"
+    )
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string via the fast formatter."""
+    return _fast_iso(time.time_ns())
+
+
+@dataclass(slots=True, frozen=True)
 class WalletTransaction:
     """Represents a transfer between two wallets."""
 
@@ -25,17 +81,118 @@ class WalletTransaction:
     amount: float
     asset: str
     memo: str
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_utc_now_iso)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentWallet:
     """Represents an AnnabanAI agent wallet profile."""
 
     agent_id: str
     address: str
     network: str
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_utc_now_iso)
+
+
+class ColumnarLedger:
+    """Columnar (structure-of-arrays) store for wallet transactions.
+
+    A list of per-object transactions is cache-hostile at ledger scale:
+    every scan chases a pointer per row. This stores sender/recipient as
+    int32 indices into an address table, amounts as float64 and timestamps
+    as int64 nanoseconds in pre-allocated NumPy arrays that grow
+    geometrically, with tx_id/asset/memo in plain string lists. Address
+    filters run as one vectorized comparison and only matching rows are
+    materialized back into WalletTransaction objects.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self) -> None:
+        if np is None:
+            raise ImportError("ColumnarLedger requires numpy")
+        capacity = self._INITIAL_CAPACITY
+        self._count = 0
+        self._senders = np.empty(capacity, dtype=np.int32)
+        self._recipients = np.empty(capacity, dtype=np.int32)
+        self._amounts = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._tx_ids: List[str] = []
+        self._assets: List[str] = []
+        self._memos: List[str] = []
+        self._addresses: List[str] = []
+        self._address_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _address_id(self, address: str) -> int:
+        """Intern an address into the address table."""
+        address_id = self._address_ids.get(address)
+        if address_id is None:
+            address_id = len(self._addresses)
+            self._address_ids[address] = address_id
+            self._addresses.append(address)
+        return address_id
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """Grow the parallel arrays geometrically to hold `needed` rows."""
+        capacity = self._timestamps.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_senders", "_recipients", "_amounts", "_timestamps"):
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self._count] = old[:self._count]
+            setattr(self, name, grown)
+
+    @staticmethod
+    def _timestamp_ns(timestamp: str) -> int:
+        """Parse an ISO-8601 UTC timestamp to nanoseconds since epoch."""
+        parsed = datetime.fromisoformat(timestamp)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        # Integer math for the sub-second part avoids float rounding.
+        whole_seconds = int(parsed.replace(microsecond=0).timestamp())
+        return whole_seconds * 1_000_000_000 + parsed.microsecond * 1_000
+
+    def record(self, tx: WalletTransaction) -> int:
+        """Append a transaction and return its row index."""
+        index = self._count
+        self._ensure_capacity(index + 1)
+        self._senders[index] = self._address_id(tx.sender_address)
+        self._recipients[index] = self._address_id(tx.recipient_address)
+        self._amounts[index] = tx.amount
+        self._timestamps[index] = self._timestamp_ns(tx.timestamp)
+        self._tx_ids.append(tx.tx_id)
+        self._assets.append(tx.asset)
+        self._memos.append(tx.memo)
+        self._count = index + 1
+        return index
+
+    def _row(self, index: int) -> WalletTransaction:
+        """Materialize one row back into a WalletTransaction."""
+        seconds, nanos = divmod(int(self._timestamps[index]), 1_000_000_000)
+        return WalletTransaction(
+            tx_id=self._tx_ids[index],
+            sender_address=self._addresses[int(self._senders[index])],
+            recipient_address=self._addresses[int(self._recipients[index])],
+            amount=float(self._amounts[index]),
+            asset=self._assets[index],
+            memo=self._memos[index],
+            timestamp=_fast_iso(seconds * 1_000_000_000 + nanos),
+        )
+
+    def transactions_for(self, address: str) -> List[WalletTransaction]:
+        """Return all transactions involving an address, in ledger order."""
+        address_id = self._address_ids.get(address)
+        if address_id is None:
+            return []
+        count = self._count
+        mask = (self._senders[:count] == address_id) | (self._recipients[:count] == address_id)
+        return [self._row(int(index)) for index in np.flatnonzero(mask)]
 
 
 class BlockchainWalletService:
@@ -49,21 +206,51 @@ class BlockchainWalletService:
         self.network = network
         self.default_asset = default_asset
         self.wallets: Dict[str, AgentWallet] = {}
-        self.balances: Dict[str, float] = {}
+        self.balances: Dict[str, float] = defaultdict(float)
+        # Wallet-address membership kept separately so transfer validation
+        # is one set probe per address instead of balance-dict lookups.
+        self._known_addresses: set = set()
         self.ledger: List[WalletTransaction] = []
+        # Per-address transaction index so filtered queries stay O(k) in
+        # the result size instead of scanning the whole ledger.
+        self._tx_by_address: Dict[str, List[WalletTransaction]] = defaultdict(list)
 
     def create_wallet(self, agent_id: str, starting_balance: float = 0.0) -> AgentWallet:
         """Create a deterministic wallet address for an agent."""
-        if agent_id in self.wallets:
-            return self.wallets[agent_id]
+        return self.create_wallets([agent_id], starting_balance)[0]
+
+    def create_wallets(self, agent_ids: Iterable[str], starting_balance: float = 0.0) -> List[AgentWallet]:
+        """Create wallets for many agents in one pass.
 
-        address_seed = f"{agent_id}:{secrets.token_hex(16)}:{self.network}".encode("utf-8")
-        address = "0x" + hashlib.sha256(address_seed).hexdigest()[:40]
+        Entropy for all new addresses comes from a single os.urandom call
+        sliced per wallet, so bulk creation pays one getrandom() syscall
+        instead of one per wallet, and the loop binds the hasher template
+        and containers to locals so the remaining per-wallet Python
+        overhead stays at the hash call itself.
+        """
+        agent_ids = list(agent_ids)
+        entropy = os.urandom(16 * len(agent_ids))
 
-        wallet = AgentWallet(agent_id=agent_id, address=address, network=self.network)
-        self.wallets[agent_id] = wallet
-        self.balances[address] = float(starting_balance)
-        return wallet
+        wallets: List[AgentWallet] = []
+        copy_hasher = _SHA256_TEMPLATE.copy
+        network = self.network
+        known_wallets = self.wallets
+        balances = self.balances
+        append = wallets.append
+
+        for index, agent_id in enumerate(agent_ids):
+            wallet = known_wallets.get(agent_id)
+            if wallet is None:
+                token = entropy[index * 16:(index + 1) * 16].hex()
+                hasher = copy_hasher()
+                hasher.update(f"{agent_id}:{token}:{network}".encode("utf-8"))
+                address = "0x" + hasher.hexdigest()[:40]
+                wallet = AgentWallet(agent_id=agent_id, address=address, network=network)
+                known_wallets[agent_id] = wallet
+                balances[address] = float(starting_balance)
+                self._known_addresses.add(address)
+            append(wallet)
+        return wallets
 
     def get_wallet(self, agent_id: str) -> Optional[AgentWallet]:
         """Return wallet details for an agent if present."""
@@ -96,20 +283,36 @@ class BlockchainWalletService:
         if amount_value <= 0:
             raise ValueError("Transfer amount must be positive")
 
-        if sender_address not in self.balances:
+        known_addresses = self._known_addresses
+        if sender_address not in known_addresses:
             raise ValueError("Unknown sender address")
-        if recipient_address not in self.balances:
+        if recipient_address not in known_addresses:
             raise ValueError("Unknown recipient address")
-        if self.balances[sender_address] < amount_value:
+
+        balances = self.balances
+        sender_balance = balances[sender_address]
+        if sender_balance < amount_value:
             raise ValueError("Insufficient funds")
 
-        self.balances[sender_address] -= amount_value
-        self.balances[recipient_address] += amount_value
+        balances[sender_address] = sender_balance - amount_value
+        balances[recipient_address] += amount_value
 
-        payload = (
-            f"{sender_address}:{recipient_address}:{amount_value}:{datetime.utcnow().isoformat()}:{memo}"
-        )
-        tx_id = "tx_" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:20]
+        # Compute the timestamp once and reuse it for both the tx_id
+        # hash and the transaction record. The id hash feeds fields into
+        # a copy of the pre-seeded hasher instead of building one large
+        # payload string per transfer.
+        timestamp = _utc_now_iso()
+        hasher = _TX_ID_TEMPLATE.copy()
+        hasher.update(sender_address.encode("utf-8"))
+        hasher.update(b":")
+        hasher.update(recipient_address.encode("utf-8"))
+        hasher.update(b":")
+        hasher.update(str(amount_value).encode("ascii"))
+        hasher.update(b":")
+        hasher.update(timestamp.encode("ascii"))
+        hasher.update(b":")
+        hasher.update(memo.encode("utf-8"))
+        tx_id = "tx_" + hasher.hexdigest()[:20]
 
         tx = WalletTransaction(
             tx_id=tx_id,
@@ -118,8 +321,12 @@ class BlockchainWalletService:
             amount=amount_value,
             asset=asset or self.default_asset,
             memo=memo,
+            timestamp=timestamp,
         )
         self.ledger.append(tx)
+        self._tx_by_address[sender_address].append(tx)
+        if recipient_address != sender_address:
+            self._tx_by_address[recipient_address].append(tx)
         return tx
 
     def list_transactions(self, address: Optional[str] = None) -> List[WalletTransaction]:
@@ -127,8 +334,4 @@ class BlockchainWalletService:
         if address is None:
             return list(self.ledger)
 
-        return [
-            tx
-            for tx in self.ledger
-            if tx.sender_address == address or tx.recipient_address == address
-        ]
+        return list(self._tx_by_address.get(address, ()))
@@ -0,0 +1,242 @@
+"""
+AnnabanAI Covenant Framework - Covenant-Aligned Response Validation
+
+Validates LLM responses against the AnnabanAI covenant principles and keeps
+provenance records for every response. All validation rules are compiled
+once at initialization: each rule set is folded into a single alternation
+regex with one named group per rule, so validate_response makes one linear
+scan over the text instead of looping per-rule re.search calls.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+# Covenant principles rendered into the covenant prompt preamble
+_COVENANT_PRINCIPLES = (
+    "Act with empathy and respect for human dignity",
+    "Be transparent about capabilities and limitations",
+    "Protect user wellbeing and avoid harm",
+    "Preserve human agency and informed consent",
+    "Remain accountable through provenance and oversight",
+)
+
+# Scoring rules as (rule_id, pattern, score_delta). Violations carry
+# negative deltas, alignment markers positive ones; each rule contributes
+# at most once per response.
+_SCORING_RULES: Tuple[Tuple[str, str, float], ...] = (
+    ("harm_language", r"\b(?:kill|destroy|attack|harm|hurt)\b", -0.3),
+    ("deception", r"\b(?:deceive|manipulate|trick|mislead)\b", -0.25),
+    ("coercion", r"\b(?:force|coerce|threaten|blackmail)\b", -0.25),
+    ("dismissiveness", r"\b(?:whatever|who cares|not my problem)\b", -0.15),
+    ("empathy_marker", r"\b(?:understand|support|care|compassion|listen)\b", 0.1),
+    ("covenant_marker", r"\b(?:covenant|dignity|transparent|transparency|consent)\b", 0.1),
+)
+
+# Rules that require a human in the loop regardless of the alignment score
+_OVERSIGHT_RULES: Tuple[Tuple[str, str], ...] = (
+    ("medical", r"\b(?:diagnos\w+|medication|prescri\w+|symptom)\b"),
+    ("legal", r"\b(?:lawsuit|legal advice|contract dispute|liabilit\w+)\b"),
+    ("financial", r"\b(?:invest\w+ advice|loan|bankruptcy|gambling)\b"),
+    ("self_harm", r"\b(?:suicide|self[- ]harm|hurt (?:myself|themselves))\b"),
+)
+
+# Starting alignment score before rule deltas are applied
+_BASE_ALIGNMENT = 0.7
+
+
+@dataclass
+class ProvenanceRecord:
+    """Provenance trail for one generated response."""
+
+    record_id: str
+    timestamp: str
+    user_input: str
+    raw_response: str
+    final_response: str
+    processing_steps: List[Dict[str, Any]]
+    human_oversight: Dict[str, Any]
+    covenant_alignment_score: float = 0.0
+
+
+class CovenantFramework:
+    """
+    Covenant validation and provenance tracking for AnnabanAI responses.
+
+    The per-rule regexes are never evaluated individually: __init__ compiles
+    each rule set into one alternation pattern whose named groups identify
+    the matching rule, so scoring a response is a single pass over the text
+    with match.lastgroup dispatching into a precomputed id -> delta table.
+    """
+
+    def __init__(self, config_path: Optional[str] = None,
+                 config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the covenant framework.
+
+        Args:
+            config_path: Path to configuration file
+            config: Pre-parsed configuration dict; when given, the file at
+                config_path is not read again
+        """
+        self.config = config if config is not None else self._load_config(config_path)
+
+        self._scoring_pattern = self._compile_union(
+            (rule_id, pattern) for rule_id, pattern, _ in _SCORING_RULES
+        )
+        self._scoring_deltas = {rule_id: delta for rule_id, _, delta in _SCORING_RULES}
+        self._oversight_pattern = self._compile_union(_OVERSIGHT_RULES)
+
+        self._alignment_threshold = float(self.config.get("alignment_threshold", 0.5))
+        self._oversight_threshold = float(self.config.get("oversight_threshold", 0.3))
+
+        # The preamble is identical for every prompt, so it is rendered once
+        principles = "\n".join(f"- {principle}" for principle in _COVENANT_PRINCIPLES)
+        self._covenant_preamble = (
+            "[AnnabanAI Covenant]\n"
+            "Respond in alignment with these covenant principles:\n"
+            f"{principles}\n\n"
+        )
+
+        self._provenance_records: Dict[str, ProvenanceRecord] = {}
+
+    def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
+        """
+        Load configuration from file or use defaults.
+
+        Args:
+            config_path: Path to configuration file
+
+        Returns:
+            Configuration dictionary
+        """
+        if config_path and os.path.exists(config_path):
+            try:
+                with open(config_path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Error loading config: {e}")
+
+        return {
+            "alignment_threshold": 0.5,
+            "oversight_threshold": 0.3
+        }
+
+    @staticmethod
+    def _compile_union(rules) -> "re.Pattern":
+        """Compile (rule_id, pattern) pairs into one named-group alternation."""
+        return re.compile(
+            "|".join(f"(?P<{rule_id}>{pattern})" for rule_id, pattern in rules),
+            re.IGNORECASE
+        )
+
+    def generate_covenant_header(self) -> str:
+        """
+        Return the covenant preamble on its own.
+
+        The preamble does not depend on the prompt, so callers that only
+        need its length or want to assemble a combined prompt themselves
+        can use this without materializing a full covenant prompt.
+        """
+        return self._covenant_preamble
+
+    def generate_covenant_prompt(self, base_prompt: str) -> str:
+        """
+        Prefix a prompt with the covenant preamble.
+
+        Args:
+            base_prompt: The prompt to wrap
+
+        Returns:
+            The covenant-framed prompt
+        """
+        return self._covenant_preamble + base_prompt
+
+    def validate_response(self, user_input: str, response: str,
+                          processed_input: str) -> Dict[str, Any]:
+        """
+        Validate a response against the covenant rules.
+
+        One scan of the combined scoring pattern accumulates the alignment
+        score; a second scan of the oversight pattern over the user input
+        and response decides whether a human review is required.
+
+        Args:
+            user_input: The original user input
+            response: The response text to validate
+            processed_input: The normalized input used for prompt generation
+
+        Returns:
+            Dict with passed, alignment_score, violations, oversight_reasons
+            and needs_human_oversight
+        """
+        fired = set()
+        for match in self._scoring_pattern.finditer(response):
+            fired.add(match.lastgroup)
+
+        deltas = self._scoring_deltas
+        score = _BASE_ALIGNMENT + sum(deltas[rule_id] for rule_id in fired)
+        score = min(1.0, max(0.0, score))
+        violations = sorted(rule_id for rule_id in fired if deltas[rule_id] < 0)
+
+        oversight_reasons = set()
+        for text in (user_input, response):
+            for match in self._oversight_pattern.finditer(text):
+                oversight_reasons.add(match.lastgroup)
+
+        return {
+            "passed": score >= self._alignment_threshold,
+            "alignment_score": score,
+            "violations": violations,
+            "oversight_reasons": sorted(oversight_reasons),
+            "needs_human_oversight": bool(oversight_reasons) or score < self._oversight_threshold
+        }
+
+    def create_provenance_record(self, user_input: str, raw_response: str,
+                                 final_response: str,
+                                 processing_steps: List[Dict[str, Any]],
+                                 human_oversight: Dict[str, Any]) -> str:
+        """
+        Create and store a provenance record for a response.
+
+        Args:
+            user_input: The original user input
+            raw_response: The raw LLM response text
+            final_response: The response after empathy and oversight
+            processing_steps: The pipeline's processing-step log
+            human_oversight: Oversight metadata for the response
+
+        Returns:
+            The new record's ID
+        """
+        timestamp = datetime.datetime.now().isoformat()
+        digest = hashlib.sha256(
+            f"{timestamp}:{user_input}:{final_response}".encode("utf-8")
+        ).hexdigest()
+        record_id = f"prov_{digest[:16]}"
+
+        alignment_score = 0.0
+        for step in processing_steps:
+            if step.get("step") == "covenant_validation":
+                alignment_score = float(step.get("alignment_score", 0.0))
+                break
+
+        self._provenance_records[record_id] = ProvenanceRecord(
+            record_id=record_id,
+            timestamp=timestamp,
+            user_input=user_input,
+            raw_response=raw_response,
+            final_response=final_response,
+            processing_steps=processing_steps,
+            human_oversight=human_oversight,
+            covenant_alignment_score=alignment_score
+        )
+        return record_id
+
+    def get_provenance_record(self, record_id: str) -> Optional[ProvenanceRecord]:
+        """Return a stored provenance record if present."""
+        return self._provenance_records.get(record_id)
@@ -0,0 +1,345 @@
+"""
+AnnabanAI Memory Vault - 3D Memory Storage and Retrieval
+
+Stores interaction memories for the AnnabanAI LLM integration in a
+structure-of-arrays layout: spatial positions, emotional vectors and
+timestamps live in parallel pre-allocated NumPy arrays, so queries run as
+vectorized filters over contiguous float32 data instead of per-object
+Python loops. String content and per-memory bookkeeping stay in plain
+Python lists alongside the arrays.
+"""
+
+import datetime
+import hashlib
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Canonical emotion axes used for the vectorized emotional similarity.
+# Unknown emotion names from callers are ignored rather than rejected.
+EMOTION_DIMENSIONS = (
+    "joy", "sadness", "anger", "fear",
+    "surprise", "disgust", "trust", "anticipation"
+)
+
+# Relevance weights combining emotional similarity, recency and stored
+# emotional weight into one score.
+_W_SIMILARITY = 0.5
+_W_RECENCY = 0.3
+_W_EMOTIONAL_WEIGHT = 0.2
+
+# Time constant (seconds) for the exponential recency decay
+_RECENCY_TAU = 7 * 24 * 3600.0
+
+# Sentinel assigned to rows filtered out by the spatial radius
+_SCORE_FILTERED = -1e30
+
+
+def _combined_scores_numpy(positions, emotions, timestamps, weights, center,
+                           query_vec, now_s, radius, use_spatial, use_emotional):
+    """Vectorized NumPy implementation of the memory scoring kernel."""
+    if use_emotional:
+        similarity = emotions @ query_vec
+    else:
+        similarity = np.zeros(positions.shape[0], dtype=np.float32)
+    recency = np.exp(-(now_s - timestamps).astype(np.float32) / _RECENCY_TAU)
+    scores = (
+        _W_SIMILARITY * similarity + _W_RECENCY * recency + _W_EMOTIONAL_WEIGHT * weights
+    ).astype(np.float32)
+    if use_spatial:
+        squared_distance = ((positions - center) ** 2).sum(axis=1)
+        scores[squared_distance > radius * radius] = _SCORE_FILTERED
+    return scores
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _combined_scores(positions, emotions, timestamps, weights, center,
+                         query_vec, now_s, radius, use_spatial, use_emotional):
+        """Numba kernel fusing the spatial filter and relevance scoring."""
+        count = positions.shape[0]
+        scores = np.empty(count, dtype=np.float32)
+        radius_sq = radius * radius
+        for i in prange(count):
+            if use_spatial:
+                squared_distance = (
+                    (positions[i, 0] - center[0]) ** 2
+                    + (positions[i, 1] - center[1]) ** 2
+                    + (positions[i, 2] - center[2]) ** 2
+                )
+                if squared_distance > radius_sq:
+                    scores[i] = _SCORE_FILTERED
+                    continue
+            similarity = 0.0
+            if use_emotional:
+                for k in range(emotions.shape[1]):
+                    similarity += emotions[i, k] * query_vec[k]
+            recency = math.exp(-(now_s - timestamps[i]) / _RECENCY_TAU)
+            scores[i] = (
+                _W_SIMILARITY * similarity
+                + _W_RECENCY * recency
+                + _W_EMOTIONAL_WEIGHT * weights[i]
+            )
+        return scores
+else:
+    _combined_scores = _combined_scores_numpy
+
+
+@dataclass
+class Memory:
+    """A single stored interaction memory."""
+
+    memory_id: str
+    content: str
+    creation_time: str
+    last_accessed: str
+    position: Tuple[float, float, float]
+    access_count: int = 0
+    emotional_weight: float = 0.0
+
+
+@dataclass
+class MemoryQuery:
+    """Query parameters for retrieving memories from the vault."""
+
+    content_keywords: List[str] = field(default_factory=list)
+    emotional_context: Optional[Dict[str, float]] = None
+    spatial_center: Optional[Tuple[float, float, float]] = None
+    spatial_radius: float = 10.0
+    time_range: Optional[Tuple[Any, Any]] = None
+    max_results: int = 10
+
+
+class MemoryVault:
+    """
+    3D memory vault with vectorized spatial, temporal and emotional queries.
+
+    Memories are placed deterministically in a cubic memory space derived
+    from their content hash. Storage is structure-of-arrays: positions
+    (float32[N, 3]), emotional vectors (float32[N, K]) and timestamps
+    (int64[N]) grow geometrically in pre-allocated arrays, so find_memories
+    filters the whole vault with a handful of NumPy operations and only
+    materializes Memory objects for the top-k surviving indices.
+    """
+
+    # Initial array capacity; doubled whenever the vault fills up
+    _INITIAL_CAPACITY = 256
+
+    # Side length of the cubic memory space positions are mapped into
+    _SPACE_EXTENT = 100.0
+
+    def __init__(self, config_path: Optional[str] = None,
+                 config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the memory vault.
+
+        Args:
+            config_path: Path to configuration file
+            config: Pre-parsed configuration dict; when given, the file at
+                config_path is not read again
+        """
+        self.config = config if config is not None else self._load_config(config_path)
+
+        capacity = self._INITIAL_CAPACITY
+        self._count = 0
+        self._positions = np.empty((capacity, 3), dtype=np.float32)
+        self._emotions = np.empty((capacity, len(EMOTION_DIMENSIONS)), dtype=np.float32)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._weights = np.empty(capacity, dtype=np.float32)
+        self._memories: List[Memory] = []
+        self._contents_lower: List[str] = []
+
+    def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
+        """
+        Load configuration from file or use defaults.
+
+        Args:
+            config_path: Path to configuration file
+
+        Returns:
+            Configuration dictionary
+        """
+        if config_path and os.path.exists(config_path):
+            try:
+                with open(config_path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Error loading config: {e}")
+
+        return {
+            "memory_retention_days": 90
+        }
+
+    def _ensure_capacity(self, needed: int):
+        """Grow the parallel arrays geometrically to hold `needed` rows."""
+        capacity = self._timestamps.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+
+        positions = np.empty((capacity, 3), dtype=np.float32)
+        emotions = np.empty((capacity, len(EMOTION_DIMENSIONS)), dtype=np.float32)
+        timestamps = np.empty(capacity, dtype=np.int64)
+        weights = np.empty(capacity, dtype=np.float32)
+        positions[:self._count] = self._positions[:self._count]
+        emotions[:self._count] = self._emotions[:self._count]
+        timestamps[:self._count] = self._timestamps[:self._count]
+        weights[:self._count] = self._weights[:self._count]
+        self._positions, self._emotions, self._timestamps = positions, emotions, timestamps
+        self._weights = weights
+
+    @classmethod
+    def _position_for(cls, content: str) -> Tuple[float, float, float]:
+        """Deterministic placement of content in the cubic memory space."""
+        digest = hashlib.sha256(content.encode("utf-8")).digest()
+        return tuple(
+            int.from_bytes(digest[i * 4:(i + 1) * 4], "little") / 2 ** 32 * cls._SPACE_EXTENT
+            for i in range(3)
+        )
+
+    @staticmethod
+    def _emotion_vector(emotion_scores: Optional[Dict[str, float]]) -> np.ndarray:
+        """Map an emotion-score dict onto the canonical emotion axes."""
+        vector = np.zeros(len(EMOTION_DIMENSIONS), dtype=np.float32)
+        if emotion_scores:
+            for index, name in enumerate(EMOTION_DIMENSIONS):
+                vector[index] = float(emotion_scores.get(name, 0.0))
+        return vector
+
+    @staticmethod
+    def _to_epoch(value: Any) -> float:
+        """Coerce a datetime, ISO string or number to epoch seconds."""
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        if isinstance(value, str):
+            return datetime.datetime.fromisoformat(value).timestamp()
+        return float(value)
+
+    def log_interaction(self, user_input: str, response: str,
+                        emotion_scores: Optional[Dict[str, float]] = None) -> str:
+        """
+        Store an interaction as a new memory.
+
+        Args:
+            user_input: The user's input text
+            response: The final response text
+            emotion_scores: Emotion scores associated with the interaction;
+                treated as read-only, so callers may pass their own dict
+                without copying
+
+        Returns:
+            The new memory's ID
+        """
+        content = f"User: {user_input}\nAnnabanAI: {response}"
+        now = datetime.datetime.now()
+        now_iso = now.isoformat()
+
+        digest = hashlib.sha256(f"{now_iso}:{content}".encode("utf-8")).hexdigest()
+        memory_id = f"mem_{digest[:16]}"
+        position = self._position_for(content)
+        emotion_vector = self._emotion_vector(emotion_scores)
+        emotional_weight = float(emotion_vector.mean()) if emotion_scores else 0.0
+
+        index = self._count
+        self._ensure_capacity(index + 1)
+        self._positions[index] = position
+        self._emotions[index] = emotion_vector
+        self._timestamps[index] = int(now.timestamp())
+        self._weights[index] = emotional_weight
+        self._memories.append(Memory(
+            memory_id=memory_id,
+            content=content,
+            creation_time=now_iso,
+            last_accessed=now_iso,
+            position=position,
+            emotional_weight=emotional_weight
+        ))
+        self._contents_lower.append(content.lower())
+        self._count = index + 1
+        return memory_id
+
+    def find_memories(self, query: MemoryQuery) -> List[Memory]:
+        """
+        Find memories matching a query.
+
+        The spatial filter and relevance scoring (emotional similarity,
+        exponential recency decay and stored emotional weight) run as one
+        fused kernel over the parallel arrays — Numba-compiled when numba
+        is installed, vectorized NumPy otherwise. Keyword filtering only
+        touches the surviving indices.
+
+        Args:
+            query: Query parameters
+
+        Returns:
+            Up to max_results matching memories, most relevant first
+        """
+        count = self._count
+        if count == 0:
+            return []
+
+        use_spatial = query.spatial_center is not None
+        center = np.asarray(
+            query.spatial_center if use_spatial else (0.0, 0.0, 0.0),
+            dtype=np.float32
+        )
+        use_emotional = bool(query.emotional_context)
+        query_vec = self._emotion_vector(query.emotional_context)
+
+        scores = _combined_scores(
+            self._positions[:count], self._emotions[:count],
+            self._timestamps[:count], self._weights[:count],
+            center, query_vec,
+            datetime.datetime.now().timestamp(), float(query.spatial_radius),
+            use_spatial, use_emotional
+        )
+
+        mask = scores > _SCORE_FILTERED / 2
+        if query.time_range is not None:
+            start, end = query.time_range
+            timestamps = self._timestamps[:count]
+            mask &= np.logical_and(
+                timestamps >= self._to_epoch(start),
+                timestamps <= self._to_epoch(end)
+            )
+
+        indices = np.nonzero(mask)[0]
+        if indices.size == 0:
+            return []
+
+        if query.content_keywords:
+            keywords = [keyword.lower() for keyword in query.content_keywords]
+            indices = np.array([
+                index for index in indices
+                if any(keyword in self._contents_lower[index] for keyword in keywords)
+            ], dtype=np.int64)
+            if indices.size == 0:
+                return []
+
+        scores = scores[indices]
+        max_results = max(1, int(query.max_results))
+        if indices.size > max_results:
+            top = np.argpartition(scores, -max_results)[-max_results:]
+            indices, scores = indices[top], scores[top]
+        order = np.argsort(scores)[::-1]
+        indices = indices[order]
+
+        now_iso = datetime.datetime.now().isoformat()
+        results = []
+        for index in indices:
+            memory = self._memories[int(index)]
+            memory.last_accessed = now_iso
+            memory.access_count += 1
+            results.append(memory)
+        return results
@@ -0,0 +1,191 @@
+"""
+Instrumented stand-ins for the AnnabanAI component modules.
+
+Main.py imports its components (empathy engine, covenant framework, memory
+vault, LLM interface, governance module) lazily; these stubs implement the
+same surface with call recording so the orchestration machinery — batching,
+pipelining, streaming, oversight — can be tested without the full runtime.
+
+install() swaps the stub modules into sys.modules and returns the entries
+it displaced; pass that mapping to restore() afterwards so other tests keep
+seeing the real modules.
+"""
+
+import enum
+import sys
+import threading
+import time
+import types
+from typing import Any, Dict, List, Optional, Tuple
+
+_MODULE_NAMES = (
+    "empathy_engine", "covenant_framework", "memory_vault",
+    "llm_interface", "governance_module"
+)
+
+
+class EmotionalSignature:
+    def __init__(self):
+        self.primary_emotion = "calm"
+        self.needs_empathetic_response = True
+        self.emotion_scores = {"calm": 0.9}
+
+
+class EmpathyEngine:
+    def __init__(self, config_path=None):
+        self.process_input_calls = 0
+
+    def process_input(self, text: str) -> Tuple[str, EmotionalSignature]:
+        self.process_input_calls += 1
+        return text.strip(), EmotionalSignature()
+
+    def generate_empathetic_prompt(self, base_prompt: str, signature) -> str:
+        return "EMP:" + base_prompt
+
+    def process_output(self, text: str, signature) -> str:
+        return text + " <3"
+
+
+class CovenantFramework:
+    def __init__(self, config_path=None):
+        self.needs_oversight = False
+        self.records: Dict[str, Dict[str, Any]] = {}
+
+    def generate_covenant_prompt(self, base_prompt: str) -> str:
+        return "COV:" + base_prompt
+
+    def validate_response(self, user_input, response, processed_input) -> Dict[str, Any]:
+        return {
+            "passed": True,
+            "alignment_score": 0.95,
+            "needs_human_oversight": self.needs_oversight
+        }
+
+    def create_provenance_record(self, **kwargs) -> str:
+        record_id = f"rec_{len(self.records)}"
+        self.records[record_id] = kwargs
+        return record_id
+
+    def get_provenance_record(self, record_id: str):
+        return None
+
+
+class MemoryQuery:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class MemoryVault:
+    def __init__(self, config_path=None):
+        self.logged: List[Tuple[str, str, Dict[str, float]]] = []
+
+    def log_interaction(self, user_input, response, emotion_scores=None) -> str:
+        self.logged.append((user_input, response, emotion_scores))
+        return f"mem_{len(self.logged)}"
+
+    def find_memories(self, query) -> list:
+        return []
+
+
+class LLMResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.model_id = "stub-1"
+        self.usage = {"total_tokens": len(text) // 4}
+
+
+class ModelProvider(enum.Enum):
+    SIMULATED = "simulated"
+
+
+class ModelParameters:
+    def __init__(self, temperature: float = 0.7, max_tokens: int = 1024):
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+
+
+class LLMInterface:
+    """Records every dispatched batch so tests can assert batch shapes."""
+
+    def __init__(self, provider, config_path=None):
+        self.provider = provider
+        self.batches: List[List[str]] = []
+        self.stream_pieces = ["piece %d " % index for index in range(10)]
+        self._lock = threading.Lock()
+
+    def generate_text(self, prompt: str, params) -> Tuple[LLMResponse, None]:
+        with self._lock:
+            self.batches.append([prompt])
+        time.sleep(0.01)
+        return LLMResponse("resp:" + prompt[:32]), None
+
+    def generate_text_batch(self, prompts: List[str], params_list) -> List[Tuple[LLMResponse, None]]:
+        with self._lock:
+            self.batches.append(list(prompts))
+        time.sleep(0.01)
+        return [(LLMResponse("resp:" + prompt[:32]), None) for prompt in prompts]
+
+    def generate_text_stream(self, prompt: str, params):
+        for piece in self.stream_pieces:
+            yield piece
+
+
+class GovernanceModule:
+    """Keeps decisions manual: tests drive submit_decision themselves."""
+
+    def __init__(self, config_path=None):
+        self.callback = None
+        self.requests: List[str] = []
+        self._statuses: Dict[str, Tuple[str, Any]] = {}
+
+    def register_notification_callback(self, callback):
+        self.callback = callback
+
+    def request_oversight(self, content, metadata) -> str:
+        request_id = f"ov_{len(self.requests)}"
+        self.requests.append(request_id)
+        self._statuses[request_id] = ("pending", None)
+        return request_id
+
+    def submit_decision(self, request_id, action, comments=""):
+        status = "approved" if action == "approve" else action
+        self._statuses[request_id] = (status, None)
+
+    def get_oversight_status(self, request_id) -> Tuple[str, Any]:
+        return self._statuses.get(request_id, ("pending", None))
+
+
+def install() -> Dict[str, Optional[types.ModuleType]]:
+    """Put the stub modules into sys.modules; returns displaced entries."""
+    exports = {
+        "empathy_engine": {
+            "EmpathyEngine": EmpathyEngine,
+            "EmotionalSignature": EmotionalSignature
+        },
+        "covenant_framework": {"CovenantFramework": CovenantFramework},
+        "memory_vault": {"MemoryVault": MemoryVault, "MemoryQuery": MemoryQuery},
+        "llm_interface": {
+            "LLMInterface": LLMInterface,
+            "ModelProvider": ModelProvider,
+            "ModelParameters": ModelParameters,
+            "LLMResponse": LLMResponse
+        },
+        "governance_module": {"GovernanceModule": GovernanceModule},
+    }
+
+    displaced = {name: sys.modules.get(name) for name in _MODULE_NAMES}
+    for name, attrs in exports.items():
+        module = types.ModuleType(name)
+        for attr, value in attrs.items():
+            setattr(module, attr, value)
+        sys.modules[name] = module
+    return displaced
+
+
+def restore(displaced: Dict[str, Optional[types.ModuleType]]) -> None:
+    """Undo install(), putting the previous modules back."""
+    for name, module in displaced.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
@@ -0,0 +1,135 @@
+import dataclasses
+import unittest
+from datetime import datetime, timezone
+
+from blockchain_wallet import BlockchainWalletService, ColumnarLedger, _fast_iso
+
+
+class FastIsoTests(unittest.TestCase):
+    def test_matches_datetime_isoformat(self) -> None:
+        for timestamp_ns in (0, 951_854_402_123_456_789, 1_767_225_599_999_999_000):
+            seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+            expected = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+                tzinfo=None, microsecond=nanos // 1_000
+            )
+            self.assertEqual(
+                _fast_iso(timestamp_ns),
+                expected.isoformat(timespec="microseconds"),
+            )
+
+
+class BlockchainWalletServiceTests(unittest.TestCase):
+    def test_create_wallet_is_idempotent_per_agent(self) -> None:
+        service = BlockchainWalletService()
+        wallet = service.create_wallet("agent-1", starting_balance=10.0)
+
+        self.assertTrue(wallet.address.startswith("0x"))
+        self.assertEqual(len(wallet.address), 42)
+        self.assertIs(service.create_wallet("agent-1"), wallet)
+        self.assertEqual(service.get_balance(wallet.address), 10.0)
+
+    def test_create_wallets_bulk(self) -> None:
+        service = BlockchainWalletService()
+        existing = service.create_wallet("agent-0", starting_balance=5.0)
+
+        wallets = service.create_wallets(["agent-0", "agent-1", "agent-2"], starting_balance=1.0)
+
+        self.assertEqual(len(wallets), 3)
+        self.assertIs(wallets[0], existing)
+        self.assertEqual(service.get_balance(existing.address), 5.0)
+        self.assertEqual(len({wallet.address for wallet in wallets}), 3)
+        self.assertEqual(service.get_balance(wallets[1].address), 1.0)
+
+    def test_transfer_updates_balances_and_ledger(self) -> None:
+        service = BlockchainWalletService()
+        sender = service.create_wallet("sender", starting_balance=10.0)
+        recipient = service.create_wallet("recipient")
+
+        tx = service.transfer(sender.address, recipient.address, 4.0, memo="test")
+
+        self.assertTrue(tx.tx_id.startswith("tx_"))
+        self.assertEqual(service.get_balance(sender.address), 6.0)
+        self.assertEqual(service.get_balance(recipient.address), 4.0)
+        self.assertEqual(service.list_transactions(), [tx])
+
+    def test_transfer_rejects_bad_amounts(self) -> None:
+        service = BlockchainWalletService()
+        sender = service.create_wallet("sender", starting_balance=1.0)
+        recipient = service.create_wallet("recipient")
+
+        with self.assertRaises(ValueError):
+            service.transfer(sender.address, recipient.address, 0)
+        with self.assertRaises(ValueError):
+            service.transfer(sender.address, recipient.address, 5.0)
+        with self.assertRaises(ValueError):
+            service.transfer(sender.address, recipient.address, "ten")
+
+    def test_list_transactions_filters_by_address(self) -> None:
+        service = BlockchainWalletService()
+        a = service.create_wallet("a", starting_balance=10.0)
+        b = service.create_wallet("b", starting_balance=10.0)
+        c = service.create_wallet("c", starting_balance=10.0)
+
+        tx_ab = service.transfer(a.address, b.address, 1.0)
+        tx_bc = service.transfer(b.address, c.address, 2.0)
+
+        self.assertEqual(service.list_transactions(a.address), [tx_ab])
+        self.assertEqual(service.list_transactions(b.address), [tx_ab, tx_bc])
+        self.assertEqual(service.list_transactions("0xunknown"), [])
+
+    def test_self_transfer_listed_once(self) -> None:
+        service = BlockchainWalletService()
+        wallet = service.create_wallet("solo", starting_balance=5.0)
+
+        tx = service.transfer(wallet.address, wallet.address, 2.0)
+
+        self.assertEqual(service.get_balance(wallet.address), 5.0)
+        self.assertEqual(service.list_transactions(wallet.address), [tx])
+
+    def test_transactions_are_immutable_and_slotted(self) -> None:
+        service = BlockchainWalletService()
+        sender = service.create_wallet("sender", starting_balance=1.0)
+        recipient = service.create_wallet("recipient")
+        tx = service.transfer(sender.address, recipient.address, 1.0)
+
+        self.assertFalse(hasattr(tx, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            tx.amount = 2.0
+
+
+class ColumnarLedgerTests(unittest.TestCase):
+    def test_record_and_filter_roundtrip(self) -> None:
+        service = BlockchainWalletService()
+        a = service.create_wallet("a", starting_balance=10.0)
+        b = service.create_wallet("b", starting_balance=10.0)
+        c = service.create_wallet("c", starting_balance=10.0)
+
+        ledger = ColumnarLedger()
+        tx_ab = service.transfer(a.address, b.address, 1.0, memo="first")
+        tx_bc = service.transfer(b.address, c.address, 2.0, memo="second")
+        ledger.record(tx_ab)
+        ledger.record(tx_bc)
+
+        self.assertEqual(len(ledger), 2)
+        self.assertEqual(ledger.transactions_for(a.address), [tx_ab])
+        self.assertEqual(ledger.transactions_for(b.address), [tx_ab, tx_bc])
+        self.assertEqual(ledger.transactions_for("0xunknown"), [])
+
+    def test_capacity_growth(self) -> None:
+        class TinyLedger(ColumnarLedger):
+            _INITIAL_CAPACITY = 2
+
+        service = BlockchainWalletService()
+        a = service.create_wallet("a", starting_balance=10_000.0)
+        b = service.create_wallet("b")
+
+        ledger = TinyLedger()
+        for _ in range(2_100):
+            ledger.record(service.transfer(a.address, b.address, 1.0))
+
+        self.assertEqual(len(ledger), 2_100)
+        self.assertEqual(len(ledger.transactions_for(a.address)), 2_100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from covenant_framework import CovenantFramework
+
+
+class CovenantFrameworkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.framework = CovenantFramework()
+
+    def test_covenant_prompt_prefixes_preamble(self) -> None:
+        prompt = self.framework.generate_covenant_prompt("How are you?")
+
+        self.assertTrue(prompt.startswith("[AnnabanAI Covenant]"))
+        self.assertTrue(prompt.endswith("How are you?"))
+
+    def test_clean_response_passes(self) -> None:
+        results = self.framework.validate_response(
+            "How do I plan my week?",
+            "I understand, and I care about helping you plan with transparency.",
+            "How do I plan my week?",
+        )
+
+        self.assertTrue(results["passed"])
+        self.assertEqual(results["violations"], [])
+        self.assertFalse(results["needs_human_oversight"])
+        self.assertGreater(results["alignment_score"], 0.7)
+
+    def test_violations_lower_alignment_score(self) -> None:
+        results = self.framework.validate_response(
+            "What should I do?",
+            "You should manipulate and threaten them until they agree.",
+            "What should I do?",
+        )
+
+        self.assertFalse(results["passed"])
+        self.assertEqual(results["violations"], ["coercion", "deception"])
+        self.assertLess(results["alignment_score"], 0.5)
+
+    def test_oversight_topics_require_review(self) -> None:
+        results = self.framework.validate_response(
+            "Should I change my medication?",
+            "Please talk with your doctor before changing anything.",
+            "Should I change my medication?",
+        )
+
+        self.assertTrue(results["needs_human_oversight"])
+        self.assertIn("medical", results["oversight_reasons"])
+
+    def test_provenance_record_roundtrip(self) -> None:
+        record_id = self.framework.create_provenance_record(
+            user_input="hello",
+            raw_response="raw",
+            final_response="final",
+            processing_steps=[
+                {"step": "covenant_validation", "passed": True, "alignment_score": 0.9}
+            ],
+            human_oversight={"required": False, "reviewer": None},
+        )
+
+        record = self.framework.get_provenance_record(record_id)
+        self.assertIsNotNone(record)
+        self.assertEqual(record.record_id, record_id)
+        self.assertEqual(record.covenant_alignment_score, 0.9)
+        self.assertIsNone(self.framework.get_provenance_record("prov_missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
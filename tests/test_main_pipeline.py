@@ -0,0 +1,161 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import stub_core_modules
+
+
+class MainPipelineTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._displaced = stub_core_modules.install()
+        import Main
+        cls.Main = Main
+
+        cls._config_dir = tempfile.TemporaryDirectory()
+        cls.config_path = os.path.join(cls._config_dir.name, "config.json")
+        with open(cls.config_path, "w") as f:
+            json.dump({
+                "llm_provider": "simulated",
+                "llm_batch_max_wait_ms": 100,
+                "stream_chunk_group_size": 4,
+                "stream_chunk_group_ms": 5000,
+                "oversight_timeout": 10
+            }, f)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._config_dir.cleanup()
+        sys.modules.pop("Main", None)
+        stub_core_modules.restore(cls._displaced)
+
+    def setUp(self) -> None:
+        self.llm = self.Main.AnnabanLLM(self.config_path)
+
+    def tearDown(self) -> None:
+        self.llm.close()
+
+    @staticmethod
+    def _wait_for(predicate, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return predicate()
+
+    def test_concurrent_requests_share_one_batch(self) -> None:
+        results = [None] * 8
+
+        def worker(index: int) -> None:
+            results[index] = self.llm.process_input(f"hello worker {index}")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertTrue(all(result and result["success"] for result in results))
+        batch_sizes = [len(batch) for batch in self.llm.llm_interface.batches]
+        self.assertTrue(
+            any(size > 1 for size in batch_sizes),
+            f"expected a shared batch, saw singleton dispatches only: {batch_sizes}"
+        )
+
+    def test_length_bins_never_mix_short_and_long_prompts(self) -> None:
+        prompts = ["hi there"] * 4 + ["x" * 4000] * 4
+
+        threads = [
+            threading.Thread(target=self.llm.process_input, args=(prompt,))
+            for prompt in prompts
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        for batch in self.llm.llm_interface.batches:
+            lengths = {len(prompt) > 1000 for prompt in batch}
+            self.assertEqual(len(lengths), 1, f"mixed-length batch: {batch}")
+
+    def test_missing_batch_responses_fail_their_futures(self) -> None:
+        batcher = self.Main._LLMRequestBatcher(
+            lambda prompts, params_list: [], max_wait_ms=1
+        )
+        try:
+            future = batcher.submit("prompt", None)
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+        finally:
+            batcher.shutdown()
+
+    def test_repeated_input_reuses_analysis(self) -> None:
+        self.llm.process_input("the same question")
+        self.llm.process_input("the same question")
+
+        self.assertEqual(self.llm.empathy_engine.process_input_calls, 1)
+
+    def test_oversight_decision_unblocks_validation(self) -> None:
+        self.llm.covenant_framework.needs_oversight = True
+        governance = self.llm.governance_module
+        holder = {}
+
+        def worker() -> None:
+            holder["result"] = self.llm.process_input("needs review")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertTrue(self._wait_for(lambda: governance.requests))
+
+        oversight_id = governance.requests[0]
+        governance.submit_decision(oversight_id, "approve")
+        self.llm._resolve_oversight(oversight_id)
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        result = holder["result"]
+        self.assertTrue(result["success"])
+        statuses = [
+            step for step in result["processing_steps"]
+            if step["step"] == "human_oversight_result"
+        ]
+        self.assertEqual(statuses[0]["status"], "approved")
+
+    def test_result_is_stable_after_return(self) -> None:
+        result = self.llm.process_input("remember this")
+        snapshot = [step["step"] for step in result["processing_steps"]]
+
+        vault = self.llm.memory_vault
+        self.assertTrue(self._wait_for(lambda: vault.logged))
+        self.assertTrue(self._wait_for(lambda: self.llm.covenant_framework.records))
+        time.sleep(0.05)
+
+        self.assertEqual([step["step"] for step in result["processing_steps"]], snapshot)
+        record = next(iter(self.llm.covenant_framework.records.values()))
+        record_steps = [step["step"] for step in record["processing_steps"]]
+        self.assertIn("memory_storage", record_steps)
+
+    def test_streaming_yields_grouped_chunks_then_result(self) -> None:
+        events = list(self.llm.process_input_stream("stream this"))
+
+        self.assertEqual(events[-1]["type"], "result")
+        self.assertTrue(events[-1]["result"]["success"])
+        chunks = [event["text"] for event in events[:-1]]
+        self.assertTrue(all(event["type"] == "chunk" for event in events[:-1]))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), "".join(self.llm.llm_interface.stream_pieces))
+
+    def test_high_impact_task_without_governance_context_is_blocked(self) -> None:
+        result = self.llm.process_input("do the thing", context={"high_impact_task": True})
+
+        self.assertFalse(result["success"])
+        self.assertIn("Execution blocked", result["response"])
+
+
+if __name__ == "__main__":
+    unittest.main()
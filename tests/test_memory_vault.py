@@ -0,0 +1,69 @@
+import unittest
+
+from memory_vault import MemoryQuery, MemoryVault
+
+
+class MemoryVaultTests(unittest.TestCase):
+    def test_log_and_keyword_query(self) -> None:
+        vault = MemoryVault()
+        memory_id = vault.log_interaction(
+            "How do I prioritize my workload?",
+            "Start with the covenant-aligned priorities.",
+            {"joy": 0.2, "trust": 0.7},
+        )
+
+        matches = vault.find_memories(MemoryQuery(content_keywords=["workload"]))
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].memory_id, memory_id)
+        self.assertEqual(matches[0].access_count, 1)
+        self.assertEqual(vault.find_memories(MemoryQuery(content_keywords=["absent"])), [])
+
+    def test_spatial_filter_uses_memory_positions(self) -> None:
+        vault = MemoryVault()
+        vault.log_interaction("alpha input", "alpha response")
+        vault.log_interaction("beta input", "beta response")
+
+        target = vault.find_memories(MemoryQuery(content_keywords=["alpha"]))[0]
+        nearby = vault.find_memories(
+            MemoryQuery(spatial_center=target.position, spatial_radius=0.5)
+        )
+
+        self.assertEqual([memory.memory_id for memory in nearby], [target.memory_id])
+
+    def test_emotional_context_ranks_by_similarity(self) -> None:
+        vault = MemoryVault()
+        vault.log_interaction("sad memory", "response", {"sadness": 0.9})
+        vault.log_interaction("joyful memory", "response", {"joy": 0.9})
+
+        matches = vault.find_memories(
+            MemoryQuery(emotional_context={"joy": 1.0}, max_results=2)
+        )
+
+        self.assertEqual(len(matches), 2)
+        self.assertIn("joyful", matches[0].content)
+
+    def test_max_results_caps_output(self) -> None:
+        vault = MemoryVault()
+        for index in range(5):
+            vault.log_interaction(f"input {index}", f"response {index}")
+
+        matches = vault.find_memories(MemoryQuery(max_results=3))
+
+        self.assertEqual(len(matches), 3)
+
+    def test_capacity_growth_preserves_queries(self) -> None:
+        class TinyVault(MemoryVault):
+            _INITIAL_CAPACITY = 2
+
+        vault = TinyVault()
+        for index in range(300):
+            vault.log_interaction(f"grow {index}", "response")
+
+        matches = vault.find_memories(MemoryQuery(content_keywords=["grow 299"]))
+
+        self.assertEqual(len(matches), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()